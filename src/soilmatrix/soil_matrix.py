@@ -2,29 +2,174 @@
 
 Fetch Soil Grids data from the SoilGrids API.
 """
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
+from queue import SimpleQueue
 from textwrap import shorten
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
 import geopandas as gpd
 import numpy as np
 import rasterio as rio
+import shapely
+from affine import Affine
 from rasterio.enums import Resampling
 from rasterio.features import geometry_mask, geometry_window
+from rasterio.io import DatasetReader
 from rasterio.vrt import WarpedVRT
 from rasterio.windows import Window, subdivide
 
 # noinspection PyUnresolvedReferences
-from soilmatrix.utils import ImmutableMeta, TaskProgress
+from soilmatrix.utils.meta_class import ImmutableMeta
+from soilmatrix.utils.progress_tracker import TaskProgress, tracked_task
+from soilmatrix.utils.type_alias import ServiceMeta
 
 __all__ = ["SoilMatrix"]
 
+# Data types of converted output, GDAL cannot write half precision floats.
+_CONVERTED_DTYPES = frozenset(("float32", "float64", "source"))
+
+class _LookupTables(NamedTuple):
+    """Lookup tables of a service database.
+
+    Attributes:
+        services (tuple[str, ...]): The service identifiers, in order.
+        service_set (frozenset[str]): The service identifiers.
+        descriptions (dict[str, str]): The service descriptions.
+        source_units (dict[str, str | None]): The source units.
+        factors (dict[str, float | None]): The conversion factors.
+        target_units (dict[str, str | None]): The target units.
+        coverages (dict[str, tuple[str, ...]]): The coverages, in order.
+        coverage_sets (dict[str, frozenset[str]]): The coverages.
+        url_paths (dict[tuple[str, str], str]): The source paths relative to
+         the base URL keyed by (service_id, coverage_id).
+    """
+    services: tuple[str, ...]
+    service_set: frozenset[str]
+    descriptions: dict[str, str]
+    source_units: dict[str, str | None]
+    factors: dict[str, float | None]
+    target_units: dict[str, str | None]
+    coverages: dict[str, tuple[str, ...]]
+    coverage_sets: dict[str, frozenset[str]]
+    url_paths: dict[tuple[str, str], str]
+
+def _build_lookup_tables(db: dict[str, ServiceMeta]) -> _LookupTables:
+    """Build the lookup tables.
+
+    Flatten a database of services into per-field lookup tables.
+
+    Args:
+        db (dict[str, ServiceMeta]): The database of services.
+
+    Returns:
+        _LookupTables: The lookup tables of the database.
+    """
+    coverages = {sid: tuple(v["coverages"]) for sid, v in db.items()}
+    return _LookupTables(
+        services=tuple(db),
+        service_set=frozenset(db),
+        descriptions={sid: v["description"] for sid, v in db.items()},
+        source_units={sid: v["source_unit"] for sid, v in db.items()},
+        factors={sid: v["conversion_factor"] for sid, v in db.items()},
+        target_units={sid: v["target_unit"] for sid, v in db.items()},
+        coverages=coverages,
+        coverage_sets={sid: frozenset(v) for sid, v in coverages.items()},
+        url_paths=_build_url_paths(db=db)
+    )
+
+def _build_url_paths(
+        db: dict[str, ServiceMeta]
+) -> dict[tuple[str, str], str]:
+    """Build the URL paths.
+
+    Construct the path of the source of every coverage of every service in a
+     database, relative to the base URL.
+
+    Args:
+        db (dict[str, ServiceMeta]): The database of services.
+
+    Returns:
+        dict[tuple[str, str], str]: The source paths keyed by
+         (service_id, coverage_id).
+    """
+    table = {}
+    for service_id, service in db.items():
+        for coverage_id in service["coverages"]:
+            if service_id == "wrb":
+                path = f"{service_id}/{coverage_id}.vrt"
+            elif service_id == "landmask":
+                path = f"{service_id}/{coverage_id}.tif"
+            else:
+                path = f"{service_id}/{service_id}_{coverage_id}.vrt"
+            table[(service_id, coverage_id)] = path
+    return table
+
+def _aligned_reader(
+        stack: ExitStack,
+        dataset: DatasetReader,
+        crs: Any,
+        resampling: Resampling,
+        transform: Affine | None = None,
+        width: int | None = None,
+        height: int | None = None
+) -> DatasetReader | WarpedVRT:
+    """Open a reader on a target grid.
+
+    Return the dataset itself if it already lies on the target grid, so that
+     reads skip the warper entirely, otherwise a WarpedVRT onto that grid
+     whose lifetime is bound to the given exit stack.
+
+    Args:
+        stack (ExitStack): The exit stack to register the WarpedVRT with.
+        dataset (DatasetReader): The source dataset.
+        crs (Any): The target coordinate reference system.
+        resampling (Resampling): The resampling method used for warping.
+        transform (Affine | None, optional): The target transform. Defaults
+         to None, i.e. the transform suggested by GDAL.
+        width (int | None, optional): The target width. Defaults to None.
+        height (int | None, optional): The target height. Defaults to None.
+
+    Returns:
+        DatasetReader | WarpedVRT: A reader on the target grid.
+    """
+    if dataset.crs == crs and (
+        transform is None or (
+            dataset.transform == transform and
+            dataset.width == width and
+            dataset.height == height
+        )
+    ):
+        return dataset
+    return stack.enter_context(
+        WarpedVRT(
+            src_dataset=dataset,
+            crs=crs,
+            transform=transform,
+            width=width,
+            height=height,
+            resampling=resampling
+        )
+    )
+
 class SoilMatrix(metaclass=ImmutableMeta):
     """Main Class: Query & fetch Soil Grids data.
 
     This is the main class for querying and fetching Soil Grids data.
+
+    Instances have no `__dict__`, as the `__slots__` of the class are
+     synthesized by its metaclass. Subclasses setting instance attributes
+     must annotate them at class level, e.g. `cache: dict[str, Any]`, so
+     that they get slots, or declare `__slots__ = ("__dict__",)`.
+
+    The lookups are served from tables derived from `DB` when a class is
+     created. Subclasses adding services define their own `DB`, e.g.
+     `DB = SoilMatrix.DB | {...}`, since editing `DB` in place is not
+     picked up.
     """
-    DB: ClassVar[dict[str, dict[str, Any]]] = {
+    DB: ClassVar[dict[str, ServiceMeta]] = {
         "bdod": {
             "description": "Bulk density of the fine earth fraction",
             "source_unit": "cg/cm³",
@@ -473,8 +618,25 @@ class SoilMatrix(metaclass=ImmutableMeta):
         }
     }
 
+    # Derived from `DB` whenever a class defines it, see `__init_subclass__`.
+    _TABLES: ClassVar[_LookupTables] = _build_lookup_tables(db=DB)
+
     BASE_URL: ClassVar[str] = "https://files.isric.org/soilgrids/latest/data"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Initialize a subclass.
+
+        Derive the lookup tables of a subclass from its own `DB`, if it
+         defines one.
+
+        Args:
+            **kwargs: Any keyword arguments will be passed to
+             `object.__init_subclass__`.
+        """
+        super().__init_subclass__(**kwargs)
+        if "DB" in cls.__dict__:
+            cls._TABLES = _build_lookup_tables(db=cls.DB)
+
     @property
     def services(self) -> list[str]:
         """List supported services.
@@ -484,7 +646,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
         Returns:
             list[str]: List of service names.
         """
-        return list(self.DB.keys())
+        return list(self._TABLES.services)
 
     @property
     def base_url(self) -> str:
@@ -508,7 +670,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
         Returns:
             bool: True if the service is valid, False otherwise.
         """
-        return service_id in self.DB
+        return service_id in self._TABLES.service_set
 
     def get_coverages(self, service_id: str) -> list[str | Any]:
         """List coverages for a service.
@@ -526,7 +688,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return self.DB[service_id]["coverages"]
+            return list(self._TABLES.coverages[service_id])
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -547,7 +709,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return coverage_id in self.DB[service_id]["coverages"]
+            return coverage_id in self._TABLES.coverage_sets[service_id]
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -568,7 +730,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return self.DB[service_id]["source_unit"]
+            return self._TABLES.source_units[service_id]
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -590,7 +752,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return self.DB[service_id]["conversion_factor"]
+            return self._TABLES.factors[service_id]
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -611,7 +773,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return self.DB[service_id]["target_unit"]
+            return self._TABLES.target_units[service_id]
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -631,7 +793,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the service_id is not valid.
         """
         if self.service_exists(service_id):
-            return self.DB[service_id]["description"]
+            return self._TABLES.descriptions[service_id]
         else:
             raise KeyError(f"Unknown Service: '{service_id}'!")
 
@@ -653,21 +815,16 @@ class SoilMatrix(metaclass=ImmutableMeta):
             KeyError: If the specified coverage is not available for the given
              service.
         """
-        if self.coverage_exists(service_id, coverage_id):
-            if service_id == "wrb":
-                return f"{self.base_url}/{service_id}/{coverage_id}.vrt"
-            elif service_id == "landmask":
-                return f"{self.base_url}/{service_id}/{coverage_id}.tif"
-            else:
-                return (
-                    f"{self.base_url}/{service_id}/" +
-                    f"{service_id}_{coverage_id}.vrt"
-                )
-        else:
+        path = self._TABLES.url_paths.get((service_id, coverage_id))
+        if path is not None:
+            return f"{self.base_url}/{path}"
+        elif self.service_exists(service_id):
             raise KeyError(
                 "Unknown Coverage:" +
                 f" '{coverage_id}' for Service: '{service_id}'!"
             )
+        else:
+            raise KeyError(f"Unknown Service: '{service_id}'!")
 
     def get_soildata(
             self,
@@ -677,6 +834,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             dst_path: str | Path,
             convert: bool = False,
             *,
+            dtype: str = "float32",
             all_touched: bool = False,
             invert: bool = False,
             block_height: int = 512,
@@ -684,6 +842,7 @@ class SoilMatrix(metaclass=ImmutableMeta):
             show_progress: bool = True,
             transient_progress: bool = False,
             resampling: str = "nearest",
+            max_workers: int = 8,
             dst_opts: dict[str, Any] | None = None
     ) -> None:
         """Ftech coverage.
@@ -698,6 +857,11 @@ class SoilMatrix(metaclass=ImmutableMeta):
              vector layer defining the area of interest (AOI).
             dst_path (str | Path): The path to save the coverage to.
             convert (bool): If True, convert the data to the target unit.
+            dtype (str): The data type of the converted data, one of
+             "float32", "float64" or "source". Floating point types store the
+             converted values, "source" keeps the source values and data type
+             and records the conversion as the band scale instead. Only used
+             if `convert` is True.
             all_touched (bool): If True, include all pixels touched by the
              AOI.
             invert (bool): If True, invert the mask so that pixels outside the
@@ -708,61 +872,232 @@ class SoilMatrix(metaclass=ImmutableMeta):
             transient_progress (bool): If True, the progress bar will be
              cleared after completion.
             resampling (str): The resampling method to use for reprojection.
+            max_workers (int): The number of threads used to fetch and process
+             the chunks concurrently.
             dst_opts (dict[str, Any]): Additional options to pass to the
              rasterio writer.
 
         Raises:
+            ValueError: If `convert` is True and the data type is not
+             supported.
             KeyError: If the service_id or coverage_id do not exist.
             Exception: If any other error occurs during the operation.
         """
+        self._fetch_coverages(
+            service_id=service_id,
+            coverage_ids=[coverage_id],
+            aoi=aoi,
+            dst_path=dst_path,
+            convert=convert,
+            dtype=dtype,
+            all_touched=all_touched,
+            invert=invert,
+            block_height=block_height,
+            block_width=block_width,
+            show_progress=show_progress,
+            transient_progress=transient_progress,
+            resampling=resampling,
+            max_workers=max_workers,
+            dst_opts=dst_opts
+        )
+
+    def get_soildata_batch(
+            self,
+            service_id: str,
+            coverage_ids: list[str],
+            aoi: gpd.GeoDataFrame | gpd.GeoSeries | gpd.array.GeometryArray,
+            dst_path: str | Path,
+            convert: bool = False,
+            *,
+            dtype: str = "float32",
+            all_touched: bool = False,
+            invert: bool = False,
+            block_height: int = 512,
+            block_width: int = 512,
+            show_progress: bool = True,
+            transient_progress: bool = False,
+            resampling: str = "nearest",
+            max_workers: int = 8,
+            dst_opts: dict[str, Any] | None = None
+    ) -> None:
+        """Fetch multiple coverages.
+
+        Fetch several coverages of the same service clipped to the given AOI
+         from the SoilGrids API and save them to disk as a single raster with
+         the bands of each coverage in the given order. The AOI mask and the
+         chunk layout are computed only once for all coverages.
+
+        Args:
+            service_id (str): The identifier of the service.
+            coverage_ids (list[str]): The identifiers of the coverages.
+            aoi (gpd.GeoDataFrame | gpd.GeoSeries | gpd.array.GeometryArray): A
+             vector layer defining the area of interest (AOI).
+            dst_path (str | Path): The path to save the coverages to.
+            convert (bool): If True, convert the data to the target unit.
+            dtype (str): The data type of the converted data, one of
+             "float32", "float64" or "source". Floating point types store the
+             converted values, "source" keeps the source values and data type
+             and records the conversion as the band scale instead. Only used
+             if `convert` is True.
+            all_touched (bool): If True, include all pixels touched by the
+             AOI.
+            invert (bool): If True, invert the mask so that pixels outside the
+             AOI are included.
+            block_height (int): The height of the chunk for tiled processing.
+            block_width (int): The width of the chunk for tiled processing.
+            show_progress (bool): If True, show a progress bar for the task.
+            transient_progress (bool): If True, the progress bar will be
+             cleared after completion.
+            resampling (str): The resampling method to use for reprojection.
+            max_workers (int): The number of threads used to fetch and process
+             the chunks concurrently.
+            dst_opts (dict[str, Any]): Additional options to pass to the
+             rasterio writer.
+
+        Raises:
+            ValueError: If no coverage_ids are given, if the coverages differ
+             in their number or data types of bands, or if `convert` is True
+             and the data type is not supported.
+            KeyError: If the service_id or any of the coverage_ids do not
+             exist.
+            Exception: If any other error occurs during the operation.
+        """
+        if not coverage_ids:
+            raise ValueError("No coverages to fetch!")
+        self._fetch_coverages(
+            service_id=service_id,
+            coverage_ids=list(coverage_ids),
+            aoi=aoi,
+            dst_path=dst_path,
+            convert=convert,
+            dtype=dtype,
+            all_touched=all_touched,
+            invert=invert,
+            block_height=block_height,
+            block_width=block_width,
+            show_progress=show_progress,
+            transient_progress=transient_progress,
+            resampling=resampling,
+            max_workers=max_workers,
+            dst_opts=dst_opts
+        )
+
+    def _fetch_coverages(
+            self,
+            service_id: str,
+            coverage_ids: list[str],
+            aoi: gpd.GeoDataFrame | gpd.GeoSeries | gpd.array.GeometryArray,
+            dst_path: str | Path,
+            convert: bool = False,
+            *,
+            dtype: str = "float32",
+            all_touched: bool = False,
+            invert: bool = False,
+            block_height: int = 512,
+            block_width: int = 512,
+            show_progress: bool = True,
+            transient_progress: bool = False,
+            resampling: str = "nearest",
+            max_workers: int = 8,
+            dst_opts: dict[str, Any] | None = None
+    ) -> None:
+        """Fetch coverages.
+
+        Fetch one or more coverages of a service clipped to the given AOI
+         into a single raster. The first coverage defines the grid, data
+         type and nodata value of the output, the bands of each coverage
+         follow one another in the given order.
+
+        See `get_soildata_batch` for the description of the arguments.
+
+        Raises:
+            ValueError: If `convert` is True and the data type is not
+             supported.
+        """
+        if convert and dtype not in _CONVERTED_DTYPES:
+            raise ValueError(f"Unsupported dtype: '{dtype}'!")
         with TaskProgress(
             disable=not show_progress,
             transient=transient_progress,
             expand=True
         ) as sink:
             task_description = shorten(
-                text=f"{service_id}_{coverage_id}", width=32, placeholder="…"
+                text=f"{service_id}_{','.join(coverage_ids)}",
+                width=32,
+                placeholder="…"
             )
-            task = sink.add_task(
+            with tracked_task(
+                sink,
                 description=task_description,
                 total=None,
                 stop_status="⚠️"
-            )
-            try:
-                url = self.get_url(
-                    service_id=service_id,
-                    coverage_id=coverage_id
-
-                )
+            ) as task:
+                urls = [
+                    self.get_url(
+                        service_id=service_id,
+                        coverage_id=coverage_id
+                    )
+                    for coverage_id in coverage_ids
+                ]
                 pad = (0.5 ** 0.5) if all_touched else 0
-                with rio.open(url, mode="r") as src_sink:
+                with (
+                    rio.Env(
+                        GDAL_CACHEMAX=512,
+                        GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+                        GDAL_HTTP_VERSION="2",
+                        GDAL_HTTP_MULTIPLEX="YES",
+                        GDAL_HTTP_MULTIRANGE="YES",
+                        GDAL_HTTP_MERGE_CONSECUTIVE_RANGES="YES",
+                        GDAL_INGESTED_BYTES_AT_OPEN=32768,
+                        CPL_VSIL_CURL_ALLOWED_EXTENSIONS=".vrt,.tif",
+                        CPL_VSIL_CURL_CACHE_SIZE=200_000_000,
+                        VSI_CACHE=True,
+                        VSI_CACHE_SIZE=50_000_000
+                    ),
+                    rio.open(urls[0], mode="r") as src_sink
+                ):
                     resampling = getattr(
                         Resampling,
                         resampling,  # type: ignore
                         Resampling.nearest
                     )
                     meta = src_sink.meta.copy()
+                    scale = None
                     if convert:
-                        meta["dtype"] = np.float32
-                        meta["nodata"] = np.nan
                         unit = self.target_unit(service_id=service_id)
                         conversion_factor = self.get_conversion_factor(
                             service_id=service_id
                         )
+                        if dtype != "source":
+                            meta["dtype"] = np.dtype(dtype)
+                            meta["nodata"] = np.nan
+                        elif conversion_factor is not None:
+                            # Keep the source values and let readers apply
+                            #  the conversion through the band scale.
+                            scale = 1.0 / conversion_factor
+                            conversion_factor = None
                     else:
                         conversion_factor = None
                         unit = self.source_unit(service_id=service_id)
                     if dst_opts:
                         meta |= dst_opts
-                    with WarpedVRT(
-                        src_dataset=src_sink,
-                        crs=meta["crs"],
-                        resampling=resampling
-                    ) as src:
-                        aoi = aoi.to_crs(src.crs).buffer(0) if isinstance(
-                            aoi, gpd.GeoSeries
-                        ) else aoi.geometry.to_crs(src.crs).buffer(0)
-                        shape = aoi.union_all()
+                    with ExitStack() as src_stack:
+                        src = _aligned_reader(
+                            stack=src_stack,
+                            dataset=src_sink,
+                            crs=meta["crs"],
+                            resampling=resampling
+                        )
+                        geoms = (
+                            aoi if isinstance(aoi, gpd.GeoSeries)
+                            else aoi.geometry
+                        ).to_crs(src.crs).to_numpy()
+                        invalid = ~shapely.is_valid(geoms)
+                        if invalid.any():
+                            geoms[invalid] = shapely.make_valid(
+                                geoms[invalid]
+                            )
+                        shape = shapely.union_all(geoms)
                         src_window = geometry_window(
                             dataset=src,
                             shapes=[shape],  # type: ignore
@@ -770,85 +1105,267 @@ class SoilMatrix(metaclass=ImmutableMeta):
                             pad_y=pad,  # type: ignore
                             boundless=False
                         )
-                        src_windows = subdivide(
-                            window=src_window,
-                            width=block_height,
-                            height=block_width
+                        # Snap the chunks to the internal tiling of the
+                        #  source, so that no source block is fetched and
+                        #  decoded by more than one chunk. Strips spanning
+                        #  the whole raster are left alone.
+                        bh, bw = src_sink.block_shapes[0]
+                        if bh < src_sink.height:
+                            block_height = -(-block_height // bh) * bh
+                        else:
+                            bh = 1
+                        if bw < src_sink.width:
+                            block_width = -(-block_width // bw) * bw
+                        else:
+                            bw = 1
+                        row_start = src_window.row_off - (
+                            src_window.row_off % bh
+                        )
+                        col_start = src_window.col_off - (
+                            src_window.col_off % bw
+                        )
+                        aligned_window = Window(
+                            col_off=col_start,  # type: ignore
+                            row_off=row_start,  # type: ignore
+                            width=(  # type: ignore
+                                src_window.col_off + src_window.width
+                                - col_start
+                            ),
+                            height=(  # type: ignore
+                                src_window.row_off + src_window.height
+                                - row_start
+                            )
+                        )
+                        # Chunk windows as rows of (col_off, row_off, width,
+                        #  height), i.e. in the field order of `Window`.
+                        src_windows = np.array(
+                            [
+                                (w.col_off, w.row_off, w.width, w.height)
+                                for w in (
+                                    cw.intersection(src_window)
+                                    for cw in subdivide(
+                                        window=aligned_window,
+                                        width=block_width,
+                                        height=block_height
+                                    )
+                                )
+                            ],
+                            dtype=np.int64
+                        )
+                        dst_windows = src_windows - np.array(
+                            [src_window.col_off, src_window.row_off, 0, 0],
+                            dtype=np.int64
                         )
-                        meta["count"]= src.count
+                        n_bands = src.count
+                        meta["count"] = n_bands * len(urls)
                         meta["height"] = src_window.height
                         meta["width"] = src_window.width
                         meta["transform"] = src.window_transform(
                             window=src_window
                         )
                         meta["crs"] = src.crs
+                        out_dtype = np.dtype(meta["dtype"])
                         if meta["nodata"] is None:
                             fill_value = 0
                         else:
-                            meta["nodata"] = fill_value = np.dtype(
-                                meta["dtype"]
-                            ).type(meta["nodata"])
+                            meta["nodata"] = fill_value = out_dtype.type(
+                                meta["nodata"]
+                            )
+                        full_mask = geometry_mask(
+                            geometries=[shape],
+                            transform=meta["transform"],
+                            out_shape=(src_window.height, src_window.width),
+                            invert=invert,  # type: ignore
+                            all_touched=all_touched  # type: ignore
+                        )
+                        empty_block = np.full(
+                            shape=(
+                                meta["count"],
+                                min(block_height, src_window.height),
+                                min(block_width, src_window.width)
+                            ),
+                            fill_value=fill_value,
+                            dtype=out_dtype
+                        )
+                        # Chunks lying entirely outside the AOI are written
+                        #  straight away and never fetched.
+                        outside = np.array(
+                            [
+                                full_mask[r:r + h, c:c + w].all()
+                                for c, r, w, h in dst_windows.tolist()
+                            ],
+                            dtype=bool
+                        )
+                        n_inside = np.count_nonzero(~outside)
+
+                        def process_tile(
+                                readers: SimpleQueue[
+                                    DatasetReader | WarpedVRT
+                                ],
+                                swin: list[int],
+                                dwin: list[int],
+                                bidx: int
+                        ) -> tuple[list[int], int, np.ndarray]:
+                            col_off, row_off, width, height = dwin
+                            mask = full_mask[
+                                row_off:row_off + height,
+                                col_off:col_off + width
+                            ]
+                            # Datasets are not thread-safe, so each worker
+                            #  borrows a dedicated reader from the pool.
+                            reader = readers.get()
+                            try:
+                                window = Window(*swin)
+                                img = reader.read(
+                                    bidx,
+                                    window=window,
+                                    masked=False
+                                )
+                                invalid = reader.read_masks(
+                                    bidx,
+                                    window=window
+                                ) == 0
+                            finally:
+                                readers.put(reader)
+                            invalid |= mask
+                            if conversion_factor is not None:
+                                # An unconditional divide vectorizes better
+                                #  than a masked one, invalid pixels are
+                                #  overwritten below anyway.
+                                img = np.divide(
+                                    img,
+                                    conversion_factor,
+                                    dtype=out_dtype
+                                )
+                            elif img.dtype != out_dtype:
+                                img = img.astype(out_dtype, copy=False)
+                            np.copyto(img, fill_value, where=invalid)
+                            return dwin, bidx, img
+
                         with rio.open(dst_path, mode="w", **meta) as dst:
                             sink.update(
                                 task_id=task,
-                                total=len(src_windows),
+                                total=len(src_windows) * meta["count"],
                                 refresh=True
                             )
-                            for swin in src_windows:
-                                swin_transform = src.window_transform(
-                                    window=swin
+                            for dwin in dst_windows[outside].tolist():
+                                dst.write(
+                                    empty_block[:, :dwin[3], :dwin[2]],
+                                    window=Window(*dwin)
                                 )
-                                dwin = Window(
-                                    row_off=(  # type: ignore
-                                        swin.row_off - src_window.row_off
-                                    ),
-                                    col_off=(  # type: ignore
-                                        swin.col_off - src_window.col_off
-                                    ),
-                                    height=swin.height,  # type: ignore
-                                    width=swin.width  # type: ignore
-                                )
-                                mask = geometry_mask(
-                                    geometries=[shape],
-                                    transform=swin_transform,
-                                    out_shape=(swin.height, swin.width),
-                                    invert=invert,  # type: ignore
-                                    all_touched=all_touched  # type: ignore
+                                sink.advance_batched(
+                                    task_id=task,
+                                    advance=meta["count"]
                                 )
-                                if not mask.all():
-                                    # noinspection PyTypeChecker
-                                    img = src.read(window=swin, masked=True)
-                                    img.mask |= np.stack(
-                                        ([mask] * meta["count"]),
-                                        axis=0
+                            for cidx, (coverage_id, url) in enumerate(
+                                zip(coverage_ids, urls, strict=True)
+                            ):
+                                band_offset = cidx * n_bands
+                                readers: SimpleQueue[
+                                    DatasetReader | WarpedVRT
+                                ] = SimpleQueue()
+                                if cidx == 0:
+                                    readers.put(src)
+                                # The pool is shut down before the readers
+                                #  are closed.
+                                with (
+                                    ExitStack() as stack,
+                                    ThreadPoolExecutor(
+                                        max_workers=max_workers
+                                    ) as executor
+                                ):
+                                    # At least one reader is opened for
+                                    #  every coverage to check its bands.
+                                    for _ in range(
+                                        max(min(max_workers, n_inside), 1)
+                                        - readers.qsize()
+                                    ):
+                                        dataset = stack.enter_context(
+                                            rio.open(url, mode="r")
+                                        )
+                                        if (
+                                            dataset.count != n_bands or
+                                            dataset.dtypes != src.dtypes
+                                        ):
+                                            raise ValueError(
+                                                "Bands of Coverage: " +
+                                                f"'{coverage_id}' do not " +
+                                                "match Coverage: " +
+                                                f"'{coverage_ids[0]}'!"
+                                            )
+                                        readers.put(
+                                            _aligned_reader(
+                                                stack=stack,
+                                                dataset=dataset,
+                                                crs=src.crs,
+                                                resampling=resampling,
+                                                transform=src.transform,
+                                                width=src.width,
+                                                height=src.height
+                                            )
+                                        )
+                                    # Bands are fetched and written one at a
+                                    #  time to keep a single band of a chunk
+                                    #  in memory per task, and only a bounded
+                                    #  number of tasks is in flight at once.
+                                    jobs = (
+                                        (swin, dwin, bidx)
+                                        for swin, dwin in zip(
+                                            src_windows[~outside].tolist(),
+                                            dst_windows[~outside].tolist(),
+                                            strict=True
+                                        )
+                                        for bidx in range(1, n_bands + 1)
                                     )
-                                    img = img.astype(meta["dtype"])
-                                    img.fill_value = fill_value
-                                    if conversion_factor is not None:
-                                        img /= conversion_factor
-                                    dst.write(img, window=dwin)
-                                else:
-                                    dst.write(
-                                        np.full(
-                                            shape=(
-                                                meta["count"],
-                                                dwin.height,
-                                                dwin.width
-                                            ),
-                                            fill_value=meta["nodata"],
-                                            dtype=meta["dtype"]
-                                        ),
-                                        window=dwin
-                                    )
-                                sink.update(
-                                    task_id=task,
-                                    advance=1,
-                                    refresh=True
+                                    pending = {
+                                        executor.submit(
+                                            process_tile, readers, *job
+                                        )
+                                        for job in islice(
+                                            jobs, 2 * max_workers
+                                        )
+                                    }
+                                    try:
+                                        while pending:
+                                            done, pending = wait(
+                                                pending,
+                                                return_when=FIRST_COMPLETED
+                                            )
+                                            for future in done:
+                                                dwin, bidx, img = (
+                                                    future.result()
+                                                )
+                                                dst.write(
+                                                    img,
+                                                    band_offset + bidx,
+                                                    window=Window(*dwin)
+                                                )
+                                                sink.advance_batched(
+                                                    task_id=task,
+                                                    advance=1
+                                                )
+                                            pending.update(
+                                                executor.submit(
+                                                    process_tile,
+                                                    readers,
+                                                    *job
+                                                )
+                                                for job in islice(
+                                                    jobs, len(done)
+                                                )
+                                            )
+                                    except BaseException:
+                                        # Skip the tiles not yet started
+                                        #  instead of fetching them all.
+                                        executor.shutdown(
+                                            wait=False,
+                                            cancel_futures=True
+                                        )
+                                        raise
+                                dst.set_band_description(
+                                    bidx=band_offset + 1,
+                                    value=f"{service_id}_{coverage_id}|{unit}"
                                 )
-                            dst.set_band_description(
-                                bidx=1,
-                                value=f"{service_id}_{coverage_id}|{unit}"
-                            )
-            except Exception as exception:
-                sink.stop_task(task_id=task)
-                raise exception
+                            if scale is not None:
+                                dst.scales = (scale,) * dst.count
+                                dst.offsets = (0.0,) * dst.count
@@ -1,18 +1,88 @@
 """Helper module.
 
 This module contains miscellaneous helper classes and functions.
+
+The helpers are imported from their submodules on first access, so that
+ importing this module does not pull in the dependencies of the helpers that
+ are not used.
 """
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "JSON_DICT",
     "JSON_LIST",
     "JSON_TYPE",
+    "JSON_UNITS",
+    "JSON_UNIT_TYPES",
     "JSON_VALUE",
     "DynamicSpinnerColumn",
     "ImmutableMeta",
-    "TaskProgress"
+    "ServiceMeta",
+    "TaskProgress",
+    "tracked_task"
 ]
 
-from .meta_class import ImmutableMeta
-from .progress_tracker import DynamicSpinnerColumn, TaskProgress
-from .type_alias import JSON_DICT, JSON_LIST, JSON_TYPE, JSON_VALUE
+_SUBMODULES: dict[str, str] = {
+    "JSON_DICT": ".type_alias",
+    "JSON_LIST": ".type_alias",
+    "JSON_TYPE": ".type_alias",
+    "JSON_UNITS": ".type_alias",
+    "JSON_UNIT_TYPES": ".type_alias",
+    "JSON_VALUE": ".type_alias",
+    "DynamicSpinnerColumn": ".progress_tracker",
+    "ImmutableMeta": ".meta_class",
+    "ServiceMeta": ".type_alias",
+    "TaskProgress": ".progress_tracker",
+    "tracked_task": ".progress_tracker"
+}
+
+if TYPE_CHECKING:
+    from .meta_class import ImmutableMeta
+    from .progress_tracker import (
+        DynamicSpinnerColumn,
+        TaskProgress,
+        tracked_task,
+    )
+    from .type_alias import (
+        JSON_DICT,
+        JSON_LIST,
+        JSON_TYPE,
+        JSON_UNIT_TYPES,
+        JSON_UNITS,
+        JSON_VALUE,
+        ServiceMeta,
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a helper lazily.
+
+    Import a helper from its submodule on first access and cache it in the
+     module namespace.
+
+    Args:
+        name (str): The name of the helper.
+
+    Returns:
+        Any: The helper.
+
+    Raises:
+        AttributeError: If the name is not a helper of this module.
+    """
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    """List the module attributes.
+
+    Returns:
+        list[str]: The names of the module attributes including the lazily
+         imported helpers.
+    """
+    return sorted((*globals(), *__all__))
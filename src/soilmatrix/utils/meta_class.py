@@ -3,14 +3,83 @@
 Module for meta classes.
 """
 
-from typing import Any
+from typing import Any, ClassVar, get_origin
+
+
+def _is_class_var(annotation: Any) -> bool:
+    """Check for a class variable annotation.
+
+    Check if an annotation declares a class variable rather than an instance
+     attribute.
+
+    Args:
+        annotation (Any): The annotation to check, either evaluated or as a
+         string.
+
+    Returns:
+        bool: True if the annotation is a `ClassVar`, False otherwise.
+    """
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
 
 
 class ImmutableMeta(type):
     """Meta Class: Immutable class variables.
 
     This metaclass makes class variables immutable.
+
+    The names of the locked class variables are snapshotted into the
+     `__immutable_names__` frozenset when the class is created, and extended
+     whenever a new class variable is set.
+
+    Classes that do not declare `__slots__` get them synthesized from their
+     annotated instance attributes, plus `__weakref__`, so their instances
+     carry no `__dict__` and must not rely on one. Subclasses have to
+     annotate the instance attributes they set, or declare `__slots__`
+     including `"__dict__"`.
     """
+    def __new__(
+            mcs,
+            name: str,
+            bases: tuple[type, ...],
+            namespace: dict[str, Any],
+            **kwargs: Any
+    ) -> "ImmutableMeta":
+        """Create a class with immutable class variables.
+
+        Create the class and record the names of its class variables.
+
+        Args:
+            name (str): The name of the class.
+            bases (tuple[type, ...]): The base classes of the class.
+            namespace (dict[str, Any]): The namespace of the class body.
+            **kwargs: Any additional keyword arguments will be passed to
+             `type.__new__`.
+
+        Returns:
+            ImmutableMeta: The newly created class.
+        """
+        if "__slots__" not in namespace:
+            slots = tuple(
+                attr
+                for attr, annotation in namespace.get(
+                    "__annotations__", {}
+                ).items()
+                if attr not in namespace and not _is_class_var(annotation)
+            )
+            # Keep instances weakly referenceable.
+            if not any(hasattr(base, "__weakref__") for base in bases):
+                slots += ("__weakref__",)
+            namespace["__slots__"] = slots
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        type.__setattr__(
+            cls,
+            "__immutable_names__",
+            frozenset((*cls.__dict__, "__immutable_names__"))
+        )
+        return cls
+
     def __setattr__(cls, name: str, value: Any) -> None:
         """Meta Class with immutable class variables.
 
@@ -23,8 +92,17 @@ class ImmutableMeta(type):
         Raises:
             AttributeError: If the class variable is already set.
         """
-        if name in cls.__dict__:
+        # Writes made while the class is still being created, e.g. by a
+        #  base class `__init_subclass__`, only see the names of the class
+        #  itself and not the set inherited from its parent.
+        immutable_names = cls.__dict__.get("__immutable_names__")
+        if immutable_names is None:
+            immutable_names = frozenset(cls.__dict__)
+        if name in immutable_names:
             raise AttributeError(
                 f"Cannot modify immutable class variable: '{name}'"
             )
-        super().__setattr__(name=name, value=value)
+        type.__setattr__(cls, name, value)
+        type.__setattr__(
+            cls, "__immutable_names__", immutable_names | {name}
+        )
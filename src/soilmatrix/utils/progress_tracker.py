@@ -2,6 +2,13 @@
 
 Helper classes for tracking progress.
 """
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from queue import SimpleQueue
+from types import SimpleNamespace
 from typing import Any
 
 from rich.console import RenderableType, StyleType, TextType
@@ -10,13 +17,100 @@ from rich.progress import (
     Progress,
     SpinnerColumn,
     Task,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeRemainingColumn,
 )
 from rich.text import Text
 
-__all__ = ["DynamicSpinnerColumn", "TaskProgress"]
+__all__ = ["DynamicSpinnerColumn", "TaskProgress", "tracked_task"]
+
+_TEXT_FORMAT = sys.intern("{task.description}:")
+_PROGRESS_FORMAT = sys.intern(
+    "[progress.percentage]{task.percentage:>3.0f}%"
+)
+
+@lru_cache(maxsize=128)
+def _parsed_markup(markup: str) -> Text:
+    """Parse markup.
+
+    Parse a rich markup string into a Text object, memoized per distinct
+     markup string.
+
+    Args:
+        markup (str): The rich markup string.
+
+    Returns:
+        Text: The parsed text. It is shared between calls and must not be
+         modified.
+    """
+    return Text.from_markup(markup)
+
+def _render_running(
+        column: "DynamicSpinnerColumn",
+        task: Task
+) -> RenderableType:
+    """Render a running task.
+
+    Args:
+        column (DynamicSpinnerColumn): The column rendering the task.
+        task (Task): The task to render.
+
+    Returns:
+        RenderableType: The current frame of the spinner.
+    """
+    return column.spinner.render(task.get_time())
+
+def _render_stopped(
+        column: "DynamicSpinnerColumn",
+        task: Task
+) -> RenderableType:
+    """Render a stopped task.
+
+    Args:
+        column (DynamicSpinnerColumn): The column rendering the task.
+        task (Task): The task to render.
+
+    Returns:
+        RenderableType: The parsed stop_status markup of the task.
+    """
+    return _parsed_markup(task.extras.stop_status).copy()  # type: ignore
+
+def _render_finished(
+        column: "DynamicSpinnerColumn",
+        task: Task
+) -> RenderableType:
+    """Render a finished task.
+
+    Args:
+        column (DynamicSpinnerColumn): The column rendering the task.
+        task (Task): The task to render.
+
+    Returns:
+        RenderableType: The finished text of the column.
+    """
+    return column.finished_text
+
+def _select_renderer(
+        task: Task
+) -> Callable[["DynamicSpinnerColumn", Task], RenderableType]:
+    """Select the renderer of a task.
+
+    Select the spinner renderer matching the current state of a task
+     created by `TaskProgress`.
+
+    Args:
+        task (Task): The task to select the renderer for.
+
+    Returns:
+        Callable[[DynamicSpinnerColumn, Task], RenderableType]: The renderer.
+    """
+    if task.finished:
+        return _render_finished
+    if task.stop_time is not None and task.extras.stop_status:  # type: ignore
+        return _render_stopped
+    return _render_running
 
 class DynamicSpinnerColumn(SpinnerColumn):
     """SpinnerColumn with optional stop state.
@@ -24,6 +118,8 @@ class DynamicSpinnerColumn(SpinnerColumn):
     This class is a modification of the original SpinnerColumn class to
      include an optional stop state.
     """
+    __slots__: tuple[str, ...] = ()
+
     def render(self, task: Task) -> RenderableType:
         """Render the spinner column.
 
@@ -31,7 +127,12 @@ class DynamicSpinnerColumn(SpinnerColumn):
 
         If the task is finished, render the finished_text string. If the task
          has been stopped, render the stop_status field as a rich
-         markup string. Otherwise, render the spinner itself.
+         markup string, parsed only once per distinct status. Otherwise,
+         render the spinner itself.
+
+        Tasks created by `TaskProgress` carry the renderer matching their
+         state in their `extras` namespace, which is called directly. Other
+         tasks have their state checked on every render.
 
         Args:
             task (Task): The task to render.
@@ -39,16 +140,16 @@ class DynamicSpinnerColumn(SpinnerColumn):
         Returns:
             RenderableType: The renderable object of the spinner column.
         """
+        extras = task.__dict__.get("extras")
+        if extras is not None:
+            return extras.render(self, task)
         if task.finished:
             return self.finished_text
-        elif (
-            getattr(task, "stop_time", None) is not None
-        ) and (
-            task.fields.get("stop_status", None)
-        ):
-            return Text.from_markup(task.fields["stop_status"])
-        else:
-            return self.spinner.render(task.get_time())
+        if task.stop_time is not None:
+            stop_status = task.fields.get("stop_status")
+            if stop_status:
+                return _parsed_markup(stop_status).copy()
+        return self.spinner.render(task.get_time())
 
 class TaskProgress(Progress):
     """Customized Progress class.
@@ -56,22 +157,25 @@ class TaskProgress(Progress):
     This class is a modification of the original Progress class to adopt a
      custom style and configuration.
     """
+    __slots__: tuple[str, ...] = ()
+
     def __init__(
         self,
         spinner_name: str = 'earth',
         spinner_finished_text: TextType = "✅",
         spinner_style: StyleType | None = 'progress.spinner',
         spinner_speed: float = 0.75,
-        text_format: str = "{task.description}:",
+        text_format: str = _TEXT_FORMAT,
         text_style: StyleType = "progress.description",
         bar_width: int | None =None,
         bar_style: StyleType = 'bar.back',
         complete_style: StyleType = 'bar.complete',
         finished_style: StyleType = 'bar.finished',
         pulse_style: StyleType = 'bar.pulse',
-        progress_format: str = '[progress.percentage]{task.percentage:>3.0f}%',
+        progress_format: str = _PROGRESS_FORMAT,
         progress_format_no_percentage: str = '??:??',
         progress_style: StyleType = 'none',
+        flush_interval: float = 0.05,
         **kwargs: Any
     ) -> None:
         """Constructor for the TaskProgress class.
@@ -109,6 +213,9 @@ class TaskProgress(Progress):
              progress column when the task is not finished. Defaults to '??:??'
             progress_style (StyleType, optional): The style of the progress
              column. Defaults to 'none'.
+            flush_interval (float, optional): The maximum delay in seconds
+             before advances accumulated by `advance_batched` are displayed.
+             Defaults to 0.05.
             **kwargs: Any additional keyword arguments will be passed to the
              `rich.Progress` constructor.
         """
@@ -142,3 +249,350 @@ class TaskProgress(Progress):
             ),
             **kwargs
         )
+        self.flush_interval = flush_interval
+        self._pending: dict[TaskID, float] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._updates: SimpleQueue[
+            tuple[TaskID, float] | threading.Event | None
+        ] = SimpleQueue()
+        self._updater: threading.Thread | None = None
+
+    def add_task(
+        self,
+        description: str,
+        start: bool = True,
+        total: float | None = 100.0,
+        completed: int = 0,
+        visible: bool = True,
+        **fields: Any
+    ) -> TaskID:
+        """Add a task.
+
+        Add a task to the progress display and attach an `extras` namespace
+         holding its stop_status field to it.
+
+        See `rich.Progress.add_task` for the description of the arguments
+         and `TaskProgress.add_tasks` for adding several tasks at once.
+
+        Returns:
+            TaskID: The identifier of the task.
+        """
+        return self.add_tasks(
+            specs=[(
+                description,
+                dict(
+                    start=start,
+                    total=total,
+                    completed=completed,
+                    visible=visible,
+                    **fields
+                )
+            )]
+        )[0]
+
+    def add_tasks(
+        self,
+        specs: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[TaskID]:
+        """Add tasks.
+
+        Add several tasks to the progress display while holding the lock
+         once, and refresh the display once afterwards. Each task gets an
+         `extras` namespace holding its stop_status field attached to it.
+
+        Args:
+            specs (Iterable[tuple[str, dict[str, Any]]]): The description and
+             the keyword arguments of `add_task` of each task.
+
+        Returns:
+            list[TaskID]: The identifiers of the tasks, in the given order.
+        """
+        task_ids = []
+        with self._lock:
+            for description, kwargs in specs:
+                fields = dict(kwargs)
+                start = fields.pop("start", True)
+                task_id = self._task_index
+                task = Task(
+                    task_id,
+                    description,
+                    fields.pop("total", 100.0),
+                    fields.pop("completed", 0),
+                    visible=fields.pop("visible", True),
+                    fields=fields,
+                    _get_time=self.get_time,
+                    _lock=self._lock
+                )
+                task.extras = SimpleNamespace(  # type: ignore
+                    stop_status=fields.get("stop_status"),
+                    render=_render_running
+                )
+                self._tasks[task_id] = task
+                if start:
+                    self.start_task(task_id)
+                task.extras.render = _select_renderer(task)  # type: ignore
+                self._task_index = TaskID(int(task_id) + 1)
+                task_ids.append(task_id)
+        self.refresh()
+        return task_ids
+
+    def stop_tasks(self, task_ids: Iterable[TaskID]) -> None:
+        """Stop tasks.
+
+        Stop several tasks while holding the lock once.
+
+        Args:
+            task_ids (Iterable[TaskID]): The identifiers of the tasks to stop.
+        """
+        self._settle()
+        with self._lock:
+            for task_id in task_ids:
+                self._stop_settled(task_id=task_id)
+
+    def update(self, task_id: TaskID, **kwargs: Any) -> None:
+        """Update a task.
+
+        Update a task and keep its `extras` namespace in sync with the
+         stop_status field and the state of the task.
+
+        See `rich.Progress.update` for the description of the arguments.
+
+        Args:
+            task_id (TaskID): The identifier of the task to update.
+            **kwargs: Any keyword arguments will be passed to
+             `rich.Progress.update`.
+        """
+        super().update(task_id, **kwargs)
+        with self._lock:
+            task = self._tasks[task_id]
+            if "stop_status" in kwargs:
+                task.extras.stop_status = (  # type: ignore
+                    kwargs["stop_status"]
+                )
+            task.extras.render = _select_renderer(task)  # type: ignore
+
+    def advance(self, task_id: TaskID, advance: float = 1) -> None:
+        """Advance a task.
+
+        Advance a task and update the renderer of its spinner.
+
+        Args:
+            task_id (TaskID): The identifier of the task to advance.
+            advance (float, optional): The amount to advance the task by.
+             Defaults to 1.
+        """
+        super().advance(task_id, advance)
+        with self._lock:
+            task = self._tasks[task_id]
+            task.extras.render = _select_renderer(task)  # type: ignore
+
+    def stop_task(self, task_id: TaskID) -> None:
+        """Stop a task.
+
+        Apply the pending advances, stop a task and update the renderer of
+         its spinner.
+
+        Args:
+            task_id (TaskID): The identifier of the task to stop.
+        """
+        self._settle()
+        self._stop_settled(task_id=task_id)
+
+    def _stop_settled(self, task_id: TaskID) -> None:
+        """Stop a settled task.
+
+        Stop a task whose advances have been applied and update the renderer
+         of its spinner.
+
+        Args:
+            task_id (TaskID): The identifier of the task to stop.
+        """
+        super().stop_task(task_id)
+        with self._lock:
+            task = self._tasks[task_id]
+            task.extras.render = _select_renderer(task)  # type: ignore
+
+    def reset(self, task_id: TaskID, **kwargs: Any) -> None:
+        """Reset a task.
+
+        Reset a task and resync its `extras` namespace with its fields and
+         state.
+
+        See `rich.Progress.reset` for the description of the arguments.
+
+        Args:
+            task_id (TaskID): The identifier of the task to reset.
+            **kwargs: Any keyword arguments will be passed to
+             `rich.Progress.reset`.
+        """
+        super().reset(task_id, **kwargs)
+        with self._lock:
+            task = self._tasks[task_id]
+            task.extras.stop_status = (  # type: ignore
+                task.fields.get("stop_status")
+            )
+            task.extras.render = _select_renderer(task)  # type: ignore
+
+    def advance_batched(
+        self,
+        task_id: TaskID,
+        advance: float = 1,
+        threshold: float = 100
+    ) -> None:
+        """Advance a task lazily.
+
+        Accumulate the advance of a task and only pass it on to the progress
+         display once the accumulated amount reaches the threshold, or at
+         the latest after `flush_interval` seconds.
+
+        Args:
+            task_id (TaskID): The identifier of the task to advance.
+            advance (float, optional): The amount to advance the task by.
+             Defaults to 1.
+            threshold (float, optional): The accumulated amount at which the
+             task is advanced right away. Defaults to 100.
+        """
+        with self._pending_lock:
+            pending = self._pending.pop(task_id, 0) + advance
+            if pending < threshold:
+                self._pending[task_id] = pending
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        interval=self.flush_interval,
+                        function=self.flush
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+            self._post(task_id=task_id, advance=pending)
+
+    def flush(self) -> None:
+        """Flush pending advances.
+
+        Pass all advances accumulated by `advance_batched` on to the
+         progress display.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            for task_id, advance in pending.items():
+                self._post(task_id=task_id, advance=advance)
+
+    def _settle(self) -> None:
+        """Settle the advances.
+
+        Flush the pending advances and wait until the updater thread has
+         applied every advance posted so far. Must not be called while
+         holding the lock, as the updater thread needs it.
+        """
+        self.flush()
+        with self._pending_lock:
+            if self._updater is None:
+                return
+            applied = threading.Event()
+            self._updates.put_nowait(applied)
+        applied.wait()
+
+    def _post(self, task_id: TaskID, advance: float) -> None:
+        """Post an advance.
+
+        Hand an advance over to the updater thread, or apply it right away if
+         the progress display is not running. Must be called while holding
+         the pending lock, so that no advance is posted after the updater
+         thread has been told to stop.
+
+        Args:
+            task_id (TaskID): The identifier of the task to advance.
+            advance (float): The amount to advance the task by.
+        """
+        if self._updater is None:
+            self._apply(task_id=task_id, advance=advance)
+        else:
+            self._updates.put_nowait((task_id, advance))
+
+    def _apply(self, task_id: TaskID, advance: float) -> None:
+        """Apply an advance.
+
+        Advance a task, ignoring tasks that have been removed in the meantime.
+
+        Args:
+            task_id (TaskID): The identifier of the task to advance.
+            advance (float): The amount to advance the task by.
+        """
+        if task_id in self._tasks:
+            self.update(task_id=task_id, advance=advance)
+
+    def _consume_updates(self) -> None:
+        """Consume posted advances.
+
+        Apply the advances posted to the update queue, and set the events
+         posted by `_settle`, until the `None` sentinel is received.
+        """
+        while (update := self._updates.get()) is not None:
+            if isinstance(update, threading.Event):
+                update.set()
+            else:
+                self._apply(*update)
+
+    def start(self) -> None:
+        """Start the progress display.
+
+        Start the progress display and the thread applying the advances.
+        """
+        super().start()
+        if self._updater is None:
+            self._updater = threading.Thread(
+                target=self._consume_updates,
+                name=f"{type(self).__name__}-updater",
+                daemon=True
+            )
+            self._updater.start()
+
+    def stop(self) -> None:
+        """Stop the progress display.
+
+        Flush pending advances, wait for the thread applying them and stop the
+         progress display.
+        """
+        self.flush()
+        with self._pending_lock:
+            updater, self._updater = self._updater, None
+            if updater is not None:
+                self._updates.put_nowait(None)
+        if updater is not None:
+            updater.join()
+        super().stop()
+
+@contextmanager
+def tracked_task(
+        sink: Progress,
+        *,
+        description: str,
+        total: float | None = None,
+        **fields: Any
+) -> Iterator[TaskID]:
+    """Track a task.
+
+    Add a task to a progress display for the duration of the context and stop
+     it on exit. A task left unfinished, e.g. by an exception, keeps its
+     stopped state on display.
+
+    Args:
+        sink (Progress): The progress display to add the task to.
+        description (str): The description of the task.
+        total (float | None, optional): The total number of steps of the
+         task. Defaults to None.
+        **fields: Any additional keyword arguments will be stored as fields
+         of the task.
+
+    Yields:
+        TaskID: The identifier of the task.
+    """
+    task_id = sink.add_task(description=description, total=total, **fields)
+    try:
+        yield task_id
+    finally:
+        sink.stop_task(task_id=task_id)
@@ -1,20 +1,53 @@
 """Type Aliases.
 
 Type aliases for custom data types.
-"""
 
+Static type checkers see the recursive JSON aliases. At runtime the aliases
+ are plain tuples of the concrete types, usable directly with `isinstance`.
+"""
+from typing import TYPE_CHECKING, TypedDict
 
 __all__ = [
     'JSON_DICT',
     'JSON_LIST',
     'JSON_TYPE',
     'JSON_UNITS',
-    'JSON_VALUE'
+    'JSON_UNIT_TYPES',
+    'JSON_VALUE',
+    'ServiceMeta'
 ]
 
-type JSON_UNITS = None | bool | int | float | str
-type JSON_VALUE = JSON_UNITS | 'JSON_LIST' | 'JSON_DICT'
-type JSON_LIST = list[JSON_VALUE]
-type JSON_DICT = dict[str, JSON_VALUE]
-# noinspection PyUnresolvedReferences
-type JSON_TYPE = 'JSON_LIST' | 'JSON_DICT'
+JSON_UNIT_TYPES: tuple[type, ...] = (type(None), bool, int, float, str)
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    JSON_UNITS: TypeAlias = None | bool | int | float | str
+    JSON_VALUE: TypeAlias = JSON_UNITS | 'JSON_LIST' | 'JSON_DICT'
+    JSON_LIST: TypeAlias = list[JSON_VALUE]
+    JSON_DICT: TypeAlias = dict[str, JSON_VALUE]
+    JSON_TYPE: TypeAlias = JSON_LIST | JSON_DICT
+else:
+    JSON_UNITS = JSON_UNIT_TYPES
+    JSON_LIST = list
+    JSON_DICT = dict
+    JSON_VALUE = (*JSON_UNITS, JSON_LIST, JSON_DICT)
+    JSON_TYPE = (JSON_LIST, JSON_DICT)
+
+
+class ServiceMeta(TypedDict):
+    """Metadata of a SoilGrids service.
+
+    Attributes:
+        description (str): The description of the service.
+        source_unit (str | None): The unit of the source data.
+        conversion_factor (float | None): The factor converting the source
+         unit into the target unit.
+        target_unit (str | None): The unit of the converted data.
+        coverages (list[str]): The coverages offered by the service.
+    """
+    description: str
+    source_unit: str | None
+    conversion_factor: float | None
+    target_unit: str | None
+    coverages: list[str]